@@ -6,15 +6,79 @@ careers with weekly turn-based actions.
 
 from __future__ import annotations
 
+import bisect
 import json
+import os
 import random
-from dataclasses import asdict, dataclass, field
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Deque, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-SAVE_FILE = Path("savegame.json")
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional binary save format
+    msgpack = None
+
+
+JSON_SAVE_FILE = Path("savegame.json")
+MSGPACK_SAVE_FILE = Path("savegame.msgpack")
+SAVE_FILE = MSGPACK_SAVE_FILE if msgpack is not None else JSON_SAVE_FILE
+HISTORY_LIMIT = 256
+
+# All game randomness comes from this instance; seed it with seed_random().
+_RNG = random.Random()
+
+# Save files are written off the main loop, one at a time and in order.
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1)
+
+
+def seed_random(value: Optional[int] = None) -> None:
+    _RNG.seed(value)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(payload: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _pack(data: Dict[str, Any]) -> bytes:
+    if msgpack is not None:
+        return msgpack.packb(data, use_bin_type=True)
+    return _dumps(data)
+
+
+def _unpack(path: Path, payload: bytes) -> Dict[str, Any]:
+    if path.suffix == ".msgpack":
+        return msgpack.unpackb(payload, raw=False)
+    return _loads(payload)
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    # Write beside the target and swap it in, so a crash mid-write never
+    # leaves a truncated save behind.
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
 
 
 class CareerStage(Enum):
@@ -37,6 +101,22 @@ WEIGHT_CLASSES: Dict[WeightClassSystem, List[int]] = {
     WeightClassSystem.NCAA: [125, 133, 141, 149, 157, 165, 174, 184, 197, 285],
 }
 
+STAGE_TO_CLASSES: Dict[CareerStage, List[int]] = {
+    CareerStage.YOUTH: WEIGHT_CLASSES[WeightClassSystem.YOUTH],
+    CareerStage.JUNIOR_HIGH: WEIGHT_CLASSES[WeightClassSystem.PIAA],
+    CareerStage.HIGH_SCHOOL: WEIGHT_CLASSES[WeightClassSystem.PIAA],
+    CareerStage.COLLEGE: WEIGHT_CLASSES[WeightClassSystem.NCAA],
+    CareerStage.POST_COLLEGE: WEIGHT_CLASSES[WeightClassSystem.NCAA],
+}
+
+# Career stage by grade; grades past the end of the table are post-college.
+_GRADE_TO_STAGE: Tuple[CareerStage, ...] = (
+    (CareerStage.YOUTH,) * 7
+    + (CareerStage.JUNIOR_HIGH,) * 2
+    + (CareerStage.HIGH_SCHOOL,) * 4
+    + (CareerStage.COLLEGE,) * 4
+)
+
 
 class InjurySeverity(Enum):
     CATASTROPHIC = auto()
@@ -52,8 +132,13 @@ SEVERITY_DURATION: Dict[InjurySeverity, Tuple[int, int]] = {
     InjurySeverity.MINOR: (1, 2),
 }
 
+# Severity odds for a new injury as a cumulative table over a 1-100 roll.
+_SEVERITIES = (InjurySeverity.MINOR, InjurySeverity.MODERATE, InjurySeverity.MAJOR, InjurySeverity.CATASTROPHIC)
+_SEV_CDF = (60, 85, 95, 100)
+_SEV_PENALTY = (3, 8, 15, 100)
+
 
-@dataclass
+@dataclass(slots=True)
 class Injury:
     name: str
     severity: InjurySeverity
@@ -69,22 +154,23 @@ class Injury:
         return self.remaining_weeks > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Finance:
     money: int = 0
-    income_history: List[str] = field(default_factory=list)
-    expense_history: List[str] = field(default_factory=list)
+    # Most recent (amount, reason) transactions; older entries roll off.
+    income_history: Deque[Tuple[int, str]] = field(default_factory=lambda: deque(maxlen=HISTORY_LIMIT))
+    expense_history: Deque[Tuple[int, str]] = field(default_factory=lambda: deque(maxlen=HISTORY_LIMIT))
 
     def add_income(self, amount: int, reason: str) -> None:
         self.money += amount
-        self.income_history.append(f"+${amount}: {reason}")
+        self.income_history.append((amount, reason))
 
     def add_expense(self, amount: int, reason: str) -> None:
         self.money -= amount
-        self.expense_history.append(f"-${amount}: {reason}")
+        self.expense_history.append((amount, reason))
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     strength: int = 40
     speed: int = 40
@@ -95,12 +181,19 @@ class Stats:
     confidence: int = 40
 
     def clamp(self) -> None:
-        for field_name in self.__dataclass_fields__:
-            value = getattr(self, field_name)
-            setattr(self, field_name, max(0, min(100, value)))
+        self.strength = max(0, min(100, self.strength))
+        self.speed = max(0, min(100, self.speed))
+        self.stamina = max(0, min(100, self.stamina))
+        self.technique = max(0, min(100, self.technique))
+        self.mentality = max(0, min(100, self.mentality))
+        self.toughness = max(0, min(100, self.toughness))
+        self.confidence = max(0, min(100, self.confidence))
 
+    def core_total(self) -> int:
+        return self.strength + self.speed + self.stamina + self.technique + self.mentality
 
-@dataclass
+
+@dataclass(slots=True)
 class Record:
     wins: int = 0
     losses: int = 0
@@ -122,7 +215,7 @@ class Record:
             self.decisions += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     hometown: str = "Pennsylvania"
@@ -138,24 +231,32 @@ class Player:
     record: Record = field(default_factory=Record)
     achievements: List[str] = field(default_factory=list)
     weight_cut_pressure: int = 0
+    _injury_penalty_sum: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._injury_penalty_sum = sum(injury.stat_penalty for injury in self.injuries if injury.is_active)
 
     def weekly_reset(self) -> None:
         self.stats.clamp()
         self.fatigue = max(0, min(100, self.fatigue))
         self.injury_risk = max(1, min(95, self.injury_risk))
+        # Tick and drop expired injuries in one pass (inlines Injury.tick and
+        # is_active); an injury with one week left expires this week.
+        survivors = []
+        penalty = 0
         for injury in self.injuries:
-            injury.tick()
-        self.injuries = [injury for injury in self.injuries if injury.is_active]
+            if injury.remaining_weeks > 1:
+                injury.remaining_weeks -= 1
+                survivors.append(injury)
+                penalty += injury.stat_penalty
+        self.injuries = survivors
+        self._injury_penalty_sum = penalty
 
     def active_injury_penalty(self) -> int:
-        return sum(injury.stat_penalty for injury in self.injuries if injury.is_active)
+        return self._injury_penalty_sum
 
     def current_weight_classes(self) -> List[int]:
-        if self.career_stage == CareerStage.YOUTH:
-            return WEIGHT_CLASSES[WeightClassSystem.YOUTH]
-        if self.career_stage == CareerStage.HIGH_SCHOOL or self.career_stage == CareerStage.JUNIOR_HIGH:
-            return WEIGHT_CLASSES[WeightClassSystem.PIAA]
-        return WEIGHT_CLASSES[WeightClassSystem.NCAA]
+        return STAGE_TO_CLASSES[self.career_stage]
 
     def adjust_weight_class(self, target: int) -> str:
         if target not in self.current_weight_classes():
@@ -167,101 +268,127 @@ class Player:
         self.injury_risk = min(95, self.injury_risk + risk_spike // 2)
         return f"Moved to {target} weight class; cut pressure now {self.weight_cut_pressure}."
 
-    def apply_action(self, action: str) -> str:
-        message = ""
-        if action == "strength":
-            gain = random.randint(1, 2)
-            self.stats.strength += gain
-            self.fatigue += 8
-            self.injury_risk += 2
-            self.finance.add_expense(10, "Weight room access")
-            message = f"Strength increased by {gain}."
-        elif action == "technique":
-            gain = random.randint(1, 3)
-            self.stats.technique += gain
-            self.stats.mentality += 1
-            self.fatigue += 6
-            self.finance.add_expense(15, "Club practice")
-            message = f"Technique increased by {gain}."
-        elif action == "film":
-            self.stats.technique += 1
+    def _do_strength(self) -> str:
+        gain = _RNG.randint(1, 2)
+        self.stats.strength += gain
+        self.fatigue += 8
+        self.injury_risk += 2
+        self.finance.add_expense(10, "Weight room access")
+        return f"Strength increased by {gain}."
+
+    def _do_technique(self) -> str:
+        gain = _RNG.randint(1, 3)
+        self.stats.technique += gain
+        self.stats.mentality += 1
+        self.fatigue += 6
+        self.finance.add_expense(15, "Club practice")
+        return f"Technique increased by {gain}."
+
+    def _do_film(self) -> str:
+        self.stats.technique += 1
+        self.stats.confidence += 1
+        self.fatigue += 3
+        self.finance.add_expense(5, "Film subscription")
+        return "Studied film and improved awareness."
+
+    def _do_condition(self) -> str:
+        self.stats.stamina += 1
+        self.stats.speed += 1
+        self.fatigue += 7
+        self.finance.add_expense(5, "Running shoes")
+        return "Conditioning improved stamina and speed."
+
+    def _do_rest(self) -> str:
+        recovered = _RNG.randint(8, 15)
+        self.fatigue = max(0, self.fatigue - recovered)
+        self.injury_risk = max(1, self.injury_risk - 2)
+        return f"Rested and recovered {recovered} fatigue."
+
+    def _do_recover(self) -> str:
+        if not self.injuries:
+            return "No injuries to rehab."
+        for injury in self.injuries:
+            injury.remaining_weeks = max(0, injury.remaining_weeks - 1)
+        self.fatigue = max(0, self.fatigue - 5)
+        self.finance.add_expense(25, "Physical therapy")
+        return "Spent the week rehabbing injuries."
+
+    def _do_weight(self) -> str:
+        reduction = _RNG.randint(1, 4)
+        self.weight_cut_pressure = max(0, self.weight_cut_pressure - reduction)
+        self.fatigue += 4
+        self.injury_risk += 1
+        return f"Managed weight; cut pressure lowered by {reduction}."
+
+    def _do_equipment(self) -> str:
+        self.finance.add_expense(50, "New headgear and shoes")
+        self.stats.confidence += 2
+        return "Purchased equipment boosting morale."
+
+    def _do_coach(self) -> str:
+        self.finance.add_expense(75, "Private coach session")
+        self.stats.technique += 2
+        self.stats.mentality += 1
+        self.fatigue += 5
+        return "Private coaching refined technique."
+
+    def _do_nil(self) -> str:
+        if self.career_stage in {CareerStage.HIGH_SCHOOL, CareerStage.COLLEGE} and self.grade >= 12:
+            earnings = _RNG.randint(50, 150)
+            self.finance.add_income(earnings, "Local NIL appearance")
             self.stats.confidence += 1
-            self.fatigue += 3
-            self.finance.add_expense(5, "Film subscription")
-            message = "Studied film and improved awareness."
-        elif action == "condition":
-            self.stats.stamina += 1
-            self.stats.speed += 1
-            self.fatigue += 7
-            self.finance.add_expense(5, "Running shoes")
-            message = "Conditioning improved stamina and speed."
-        elif action == "rest":
-            recovered = random.randint(8, 15)
-            self.fatigue = max(0, self.fatigue - recovered)
-            self.injury_risk = max(1, self.injury_risk - 2)
-            message = f"Rested and recovered {recovered} fatigue."
-        elif action == "recover":
-            if not self.injuries:
-                message = "No injuries to rehab."
-            else:
-                for injury in self.injuries:
-                    injury.remaining_weeks = max(0, injury.remaining_weeks - 1)
-                self.fatigue = max(0, self.fatigue - 5)
-                self.finance.add_expense(25, "Physical therapy")
-                message = "Spent the week rehabbing injuries."
-        elif action == "weight":
-            reduction = random.randint(1, 4)
-            self.weight_cut_pressure = max(0, self.weight_cut_pressure - reduction)
-            self.fatigue += 4
-            self.injury_risk += 1
-            message = f"Managed weight; cut pressure lowered by {reduction}."
-        elif action == "equipment":
-            self.finance.add_expense(50, "New headgear and shoes")
-            self.stats.confidence += 2
-            message = "Purchased equipment boosting morale."
-        elif action == "coach":
-            self.finance.add_expense(75, "Private coach session")
-            self.stats.technique += 2
-            self.stats.mentality += 1
-            self.fatigue += 5
-            message = "Private coaching refined technique."
-        elif action == "nil":
-            if self.career_stage in {CareerStage.HIGH_SCHOOL, CareerStage.COLLEGE} and self.grade >= 12:
-                earnings = random.randint(50, 150)
-                self.finance.add_income(earnings, "Local NIL appearance")
-                self.stats.confidence += 1
-                message = f"Secured a small NIL deal worth ${earnings}."
-            else:
-                message = "Not eligible for NIL at this stage."
-        else:
-            message = "Unknown action."
+            return f"Secured a small NIL deal worth ${earnings}."
+        return "Not eligible for NIL at this stage."
+
+    _ACTIONS: ClassVar[Dict[str, Callable[["Player"], str]]] = {
+        "strength": _do_strength,
+        "technique": _do_technique,
+        "film": _do_film,
+        "condition": _do_condition,
+        "rest": _do_rest,
+        "recover": _do_recover,
+        "weight": _do_weight,
+        "equipment": _do_equipment,
+        "coach": _do_coach,
+        "nil": _do_nil,
+    }
 
+    def apply_action(self, action: str) -> str:
+        handler = self._ACTIONS.get(action)
+        message = handler(self) if handler else "Unknown action."
         self.weekly_reset()
         return message
 
     def season_progression(self) -> None:
         self.age += 1
         self.grade += 1
-        if self.grade <= 6:
-            self.career_stage = CareerStage.YOUTH
-        elif self.grade <= 8:
-            self.career_stage = CareerStage.JUNIOR_HIGH
-        elif self.grade <= 12:
-            self.career_stage = CareerStage.HIGH_SCHOOL
-        elif self.grade <= 16:
-            self.career_stage = CareerStage.COLLEGE
+        if self.grade < len(_GRADE_TO_STAGE):
+            self.career_stage = _GRADE_TO_STAGE[self.grade]
         else:
             self.career_stage = CareerStage.POST_COLLEGE
 
-        # Update weight class band to closest option in new system
+        # Update weight class band to closest option in new system (classes
+        # are sorted; ties resolve to the lighter class)
         classes = self.current_weight_classes()
-        closest = min(classes, key=lambda c: abs(c - self.weight_class))
+        idx = bisect.bisect_left(classes, self.weight_class)
+        if idx == 0:
+            closest = classes[0]
+        elif idx == len(classes):
+            closest = classes[-1]
+        else:
+            lower, upper = classes[idx - 1], classes[idx]
+            closest = lower if self.weight_class - lower <= upper - self.weight_class else upper
         self.weight_class = closest
         if self.career_stage == CareerStage.COLLEGE and self.grade == 13:
             self.finance.add_income(500, "Scholarship stipend")
 
 
-@dataclass
+# Opponent base rating per CareerStage, indexed by stage.value - 1.
+_STAGE_BASE = (35, 45, 55, 65, 70)
+_TIERS = ("local", "district", "regional", "state", "national")
+
+
+@dataclass(slots=True)
 class Opponent:
     name: str
     tier: str
@@ -269,86 +396,98 @@ class Opponent:
 
     @staticmethod
     def generate_for_stage(stage: CareerStage) -> "Opponent":
-        base = {
-            CareerStage.YOUTH: 35,
-            CareerStage.JUNIOR_HIGH: 45,
-            CareerStage.HIGH_SCHOOL: 55,
-            CareerStage.COLLEGE: 65,
-            CareerStage.POST_COLLEGE: 70,
-        }[stage]
-        spread = random.randint(0, 20)
+        base = _STAGE_BASE[stage.value - 1]
+        spread = _RNG.randint(0, 20)
+        # One uniform draw split into six independent uniform rolls by
+        # mixed-radix decomposition, instead of six separate randint calls.
+        full = spread + 1
+        half = spread // 2 + 1
+        packed = _RNG.randrange(full**4 * half**2)
+        packed, strength = divmod(packed, full)
+        packed, speed = divmod(packed, full)
+        packed, stamina = divmod(packed, full)
+        packed, technique = divmod(packed, full)
+        toughness, mentality = divmod(packed, half)
         stats = Stats(
-            strength=base + random.randint(0, spread),
-            speed=base + random.randint(0, spread),
-            stamina=base + random.randint(0, spread),
-            technique=base + random.randint(0, spread),
-            mentality=base + random.randint(0, spread // 2),
-            toughness=base + random.randint(0, spread // 2),
+            strength=base + strength,
+            speed=base + speed,
+            stamina=base + stamina,
+            technique=base + technique,
+            mentality=base + mentality,
+            toughness=base + toughness,
             confidence=base,
         )
         stats.clamp()
-        tier = random.choice(["local", "district", "regional", "state", "national"])
+        tier = _RNG.choice(_TIERS)
         return Opponent(name="Tough Rival", tier=tier, stats=stats)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchOutcome:
     result: str
+    is_win: bool
     pinned: bool = False
     major: bool = False
 
-    @property
-    def is_win(self) -> bool:
-        return self.result.startswith("Win")
+
+# Bout outcomes indexed by the code _resolve_bout returns:
+# (result, is_win, pinned, major).
+_OUTCOMES: Tuple[Tuple[str, bool, bool, bool], ...] = (
+    ("Win by pin", True, True, False),
+    ("Win by major decision", True, False, True),
+    ("Win by decision", True, False, False),
+    ("Loss by pin", False, True, False),
+    ("Loss by major decision", False, False, True),
+    ("Loss by decision", False, False, False),
+)
+
+
+# A bout's randomness is one draw from range(_BOUT_ROLLS), split into a
+# score swing in [-20, 20] and a threshold shift in [-10, 10].
+_BOUT_ROLLS = 41 * 21
+
+
+def _resolve_bout(player_score: int, opp_score: int, roll: int) -> int:
+    variability, threshold_delta = divmod(roll, 21)
+    player_score += variability - 20
+    threshold = opp_score + threshold_delta - 10
+    if player_score - threshold > 20:
+        return 0
+    if player_score > threshold + 10:
+        return 1
+    if player_score > threshold:
+        return 2
+    if threshold - player_score > 20:
+        return 3
+    if threshold > player_score + 10:
+        return 4
+    return 5
+
+
+def _record_bout(player: Player, code: int) -> MatchOutcome:
+    outcome = MatchOutcome(*_OUTCOMES[code])
+    player.record.log_result(outcome)
+    player.stats.confidence += 2 if outcome.is_win else -2
+    player.stats.confidence = max(0, min(100, player.stats.confidence))
+    return outcome
 
 
 class Match:
+    __slots__ = ("player", "opponent")
+
     def __init__(self, player: Player, opponent: Opponent):
         self.player = player
         self.opponent = opponent
 
     def simulate(self) -> MatchOutcome:
         penalty = self.player.active_injury_penalty()
-        player_score = (
-            self.player.stats.strength
-            + self.player.stats.technique
-            + self.player.stats.speed
-            + self.player.stats.stamina
-            + self.player.stats.mentality
-            - self.player.fatigue
-            - penalty
-        )
-        opp_score = (
-            self.opponent.stats.strength
-            + self.opponent.stats.technique
-            + self.opponent.stats.speed
-            + self.opponent.stats.stamina
-            + self.opponent.stats.mentality
-        )
-        variability = random.randint(-20, 20)
-        player_score += variability
-        threshold = opp_score + random.randint(-10, 10)
-
-        if player_score - threshold > 20:
-            outcome = MatchOutcome("Win by pin", pinned=True)
-        elif player_score > threshold + 10:
-            outcome = MatchOutcome("Win by major decision", major=True)
-        elif player_score > threshold:
-            outcome = MatchOutcome("Win by decision")
-        elif threshold - player_score > 20:
-            outcome = MatchOutcome("Loss by pin", pinned=True)
-        elif threshold > player_score + 10:
-            outcome = MatchOutcome("Loss by major decision", major=True)
-        else:
-            outcome = MatchOutcome("Loss by decision")
+        player_score = self.player.stats.core_total() - self.player.fatigue - penalty
+        opp_score = self.opponent.stats.core_total()
+        code = _resolve_bout(player_score, opp_score, _RNG.randrange(_BOUT_ROLLS))
+        return _record_bout(self.player, code)
 
-        self.player.record.log_result(outcome)
-        self.player.stats.confidence += 2 if outcome.is_win else -2
-        self.player.stats.confidence = max(0, min(100, self.player.stats.confidence))
-        return outcome
 
-
-@dataclass
+@dataclass(slots=True)
 class Tournament:
     name: str
     level: str
@@ -357,9 +496,15 @@ class Tournament:
     def run(self, player: Player) -> str:
         wins = 0
         losses = 0
+        # Only confidence changes between bouts, and it does not feed the
+        # score, so the player's side is computed once for the bracket.
+        score = player.stats.core_total() - player.fatigue - player.active_injury_penalty()
+        generate = Opponent.generate_for_stage
+        randrange = _RNG.randrange
         for _ in range(self.bracket_size // 2):
-            opponent = Opponent.generate_for_stage(player.career_stage)
-            outcome = Match(player, opponent).simulate()
+            opponent = generate(player.career_stage)
+            code = _resolve_bout(score, opponent.stats.core_total(), randrange(_BOUT_ROLLS))
+            outcome = _record_bout(player, code)
             if outcome.is_win:
                 wins += 1
             else:
@@ -370,7 +515,7 @@ class Tournament:
         return f"Tournament {self.name} ({self.level}) result: {placement}."
 
 
-@dataclass
+@dataclass(slots=True)
 class Season:
     player: Player
     week: int = 1
@@ -407,21 +552,35 @@ class Season:
         return Tournament(name=self.postseason_phase, level=self.player.career_stage.name)
 
 
+def _load_history(entries: List[Any]) -> Deque[Tuple[int, str]]:
+    history: Deque[Tuple[int, str]] = deque(maxlen=HISTORY_LIMIT)
+    for entry in entries:
+        if isinstance(entry, str):
+            # Older saves stored preformatted "+$50: reason" strings.
+            amount, _, reason = entry.partition(": ")
+            history.append((int(amount.lstrip("+-$")), reason))
+        else:
+            history.append((entry[0], entry[1]))
+    return history
+
+
 class SaveLoadSystem:
+    _pending_write: Optional[Future] = None
+
     @staticmethod
-    def save(player: Player, season: Season) -> None:
-        data = {
-            "player": asdict(player),
-            "season": {
-                "week": season.week,
-                "in_season": season.in_season,
-                "postseason_phase": season.postseason_phase,
-                "recruitment_interest": season.recruitment_interest,
-            },
-            "career_stage": player.career_stage.name,
+    def serialize(player: Player, season: Season) -> Dict[str, Any]:
+        # A fresh shallow dict per call: nested objects become plain dicts,
+        # enums are stored by name, and nothing aliases live game state.
+        player_data = {f.name: getattr(player, f.name) for f in fields(player) if f.init}
+        player_data["career_stage"] = player.career_stage.name
+        player_data["stats"] = {f.name: getattr(player.stats, f.name) for f in fields(player.stats)}
+        player_data["finance"] = {
+            "money": player.finance.money,
+            "income_history": list(player.finance.income_history),
+            "expense_history": list(player.finance.expense_history),
         }
-        data["player"]["career_stage"] = player.career_stage.name
-        data["player"]["injuries"] = [
+        player_data["record"] = {f.name: getattr(player.record, f.name) for f in fields(player.record)}
+        player_data["injuries"] = [
             {
                 "name": inj.name,
                 "severity": inj.severity.name,
@@ -430,18 +589,62 @@ class SaveLoadSystem:
             }
             for inj in player.injuries
         ]
-        with SAVE_FILE.open("w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2)
+        player_data["achievements"] = list(player.achievements)
+        return {
+            "player": player_data,
+            "season": {
+                "week": season.week,
+                "in_season": season.in_season,
+                "postseason_phase": season.postseason_phase,
+                "recruitment_interest": season.recruitment_interest,
+            },
+            "career_stage": player.career_stage.name,
+        }
+
+    @staticmethod
+    def save(player: Player, season: Season) -> None:
+        # Surface a failure from the previous write before queueing another.
+        SaveLoadSystem.flush()
+        # Encode on the caller's thread, while the game state is not
+        # changing; only the disk write is handed to the pool.
+        payload = _pack(SaveLoadSystem.serialize(player, season))
+        SaveLoadSystem._pending_write = _SAVE_POOL.submit(_write_atomic, SAVE_FILE, payload)
+
+    @staticmethod
+    def flush() -> None:
+        # Wait for the queued write and re-raise its error, reporting each
+        # failure exactly once.
+        pending = SaveLoadSystem._pending_write
+        SaveLoadSystem._pending_write = None
+        if pending is not None:
+            pending.result()
+
+    @staticmethod
+    def export_json(player: Player, season: Season, path: Path = JSON_SAVE_FILE) -> None:
+        SaveLoadSystem.flush()
+        _write_atomic(path, _dumps(SaveLoadSystem.serialize(player, season)))
 
     @staticmethod
     def load() -> Optional[Tuple[Player, Season]]:
-        if not SAVE_FILE.exists():
+        SaveLoadSystem.flush()
+        if msgpack is None and MSGPACK_SAVE_FILE.exists():
+            # Never fall back to an older JSON save over a newer binary one.
+            raise RuntimeError(
+                f"{MSGPACK_SAVE_FILE} exists but the msgpack package is not installed; install it to load this save."
+            )
+        # Fall back to a JSON save written before the msgpack format existed.
+        path = SAVE_FILE if SAVE_FILE.exists() else JSON_SAVE_FILE
+        if not path.exists():
             return None
-        with SAVE_FILE.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = _unpack(path, path.read_bytes())
         player_data = data["player"]
         stats = Stats(**player_data["stats"])
-        finance = Finance(**player_data["finance"])
+        finance_data = player_data["finance"]
+        finance = Finance(
+            money=finance_data["money"],
+            income_history=_load_history(finance_data.get("income_history", [])),
+            expense_history=_load_history(finance_data.get("expense_history", [])),
+        )
         record = Record(**player_data["record"])
         injuries = [
             Injury(
@@ -487,38 +690,56 @@ class RandomEvents:
         ("equipment_break", 0.04),
         ("recruiting_bump", 0.02),
     ]
+    _EVENT_NAMES = tuple(name for name, _ in EVENTS)
+    _EVENT_CDF = tuple(accumulate(prob for _, prob in EVENTS))
+
+    @staticmethod
+    def _illness(player: Player, season: Season) -> str:
+        penalty = _RNG.randint(2, 5)
+        player.stats.stamina = max(0, player.stats.stamina - penalty)
+        player.fatigue = min(100, player.fatigue + 10)
+        return "Caught a cold; stamina dipped temporarily."
+
+    @staticmethod
+    def _bad_cut(player: Player, season: Season) -> str:
+        player.fatigue = min(100, player.fatigue + 15)
+        player.injury_risk = min(95, player.injury_risk + 10)
+        return "Rough weight cut increased fatigue and injury risk."
+
+    @staticmethod
+    def _rival(player: Player, season: Season) -> str:
+        player.stats.confidence += 3
+        return "A rival emerged, motivating harder training."
+
+    @staticmethod
+    def _equipment_break(player: Player, season: Season) -> str:
+        player.finance.add_expense(30, "Replaced broken gear")
+        return "Gear broke unexpectedly, costing money."
+
+    @staticmethod
+    def _recruiting_bump(player: Player, season: Season) -> str:
+        season.recruitment_interest += 5
+        return "Outstanding performance attracted college scouts."
+
+    _HANDLERS = {
+        "illness": _illness,
+        "bad_cut": _bad_cut,
+        "rival": _rival,
+        "equipment_break": _equipment_break,
+        "recruiting_bump": _recruiting_bump,
+    }
 
     @staticmethod
     def trigger(player: Player, season: Season) -> Optional[str]:
-        roll = random.random()
-        cumulative = 0.0
-        for name, prob in RandomEvents.EVENTS:
-            cumulative += prob
-            if roll < cumulative:
-                return RandomEvents.apply(name, player, season)
-        return None
+        idx = bisect.bisect_right(RandomEvents._EVENT_CDF, _RNG.random())
+        if idx == len(RandomEvents._EVENT_NAMES):
+            return None
+        return RandomEvents._HANDLERS[RandomEvents._EVENT_NAMES[idx]](player, season)
 
     @staticmethod
     def apply(name: str, player: Player, season: Season) -> str:
-        if name == "illness":
-            penalty = random.randint(2, 5)
-            player.stats.stamina = max(0, player.stats.stamina - penalty)
-            player.fatigue = min(100, player.fatigue + 10)
-            return "Caught a cold; stamina dipped temporarily."
-        if name == "bad_cut":
-            player.fatigue = min(100, player.fatigue + 15)
-            player.injury_risk = min(95, player.injury_risk + 10)
-            return "Rough weight cut increased fatigue and injury risk."
-        if name == "rival":
-            player.stats.confidence += 3
-            return "A rival emerged, motivating harder training."
-        if name == "equipment_break":
-            player.finance.add_expense(30, "Replaced broken gear")
-            return "Gear broke unexpectedly, costing money."
-        if name == "recruiting_bump":
-            season.recruitment_interest += 5
-            return "Outstanding performance attracted college scouts."
-        return ""
+        handler = RandomEvents._HANDLERS.get(name)
+        return handler(player, season) if handler else ""
 
 
 def render_status(player: Player, season: Season) -> str:
@@ -588,8 +809,8 @@ def weekly_menu() -> str:
     return "\n".join(["Choose an action:", border, body, footer])
 
 
-def process_choice(choice: str, player: Player, season: Season) -> Optional[str]:
-    actions = {
+_CHOICE_TO_ACTION = MappingProxyType(
+    {
         "1": "technique",
         "2": "strength",
         "3": "condition",
@@ -600,8 +821,13 @@ def process_choice(choice: str, player: Player, season: Season) -> Optional[str]
         "8": "coach",
         "9": "nil",
     }
-    if choice in actions:
-        return player.apply_action(actions[choice])
+)
+
+
+def process_choice(choice: str, player: Player, season: Season) -> Optional[str]:
+    action = _CHOICE_TO_ACTION.get(choice)
+    if action:
+        return player.apply_action(action)
     if choice == "10":
         if not season.in_season:
             return "Dual meets only occur in season."
@@ -614,26 +840,33 @@ def process_choice(choice: str, player: Player, season: Season) -> Optional[str]
         tourney = Tournament(name="Local Open", level=player.career_stage.name)
         return tourney.run(player)
     if choice == "12":
-        SaveLoadSystem.save(player, season)
-        return "Game saved."
+        try:
+            SaveLoadSystem.save(player, season)
+        except OSError as exc:
+            return f"Previous save failed ({exc}); try saving again."
+        return "Saving game in the background."
     if choice == "13":
-        SaveLoadSystem.save(player, season)
+        try:
+            SaveLoadSystem.save(player, season)
+            SaveLoadSystem.flush()
+        except OSError as exc:
+            return f"Save failed ({exc}); not quitting."
         return None
     return "Invalid selection"
 
 
 def apply_injury_risk(player: Player) -> Optional[str]:
-    roll = random.randint(1, 100)
+    randint = _RNG.randint
+    roll = randint(1, 100)
     if roll <= player.injury_risk:
-        severity = random.choices(
-            [InjurySeverity.MINOR, InjurySeverity.MODERATE, InjurySeverity.MAJOR, InjurySeverity.CATASTROPHIC],
-            weights=[60, 25, 10, 5],
-        )[0]
+        idx = bisect.bisect_left(_SEV_CDF, randint(1, 100))
+        severity = _SEVERITIES[idx]
         duration_range = SEVERITY_DURATION[severity]
-        duration = random.randint(*duration_range)
-        penalty = {InjurySeverity.MINOR: 3, InjurySeverity.MODERATE: 8, InjurySeverity.MAJOR: 15, InjurySeverity.CATASTROPHIC: 100}[severity]
+        duration = randint(*duration_range)
+        penalty = _SEV_PENALTY[idx]
         injury = Injury(name=f"{severity.name.title()} injury", severity=severity, remaining_weeks=duration, stat_penalty=penalty)
         player.injuries.append(injury)
+        player._injury_penalty_sum += injury.stat_penalty
         if severity == InjurySeverity.CATASTROPHIC:
             player.achievements.append("Career ended due to injury")
         return f"Injury occurred: {injury.name} lasting {duration} weeks."
@@ -671,6 +904,11 @@ def main() -> None:
             print(result)
         season.advance_week()
 
+    try:
+        SaveLoadSystem.flush()
+    finally:
+        _SAVE_POOL.shutdown(wait=True)
+
 
 if __name__ == "__main__":
     main()